@@ -3,31 +3,534 @@
 This includes DuckDBStream and DuckDBConnector.
 """
 
+import atexit
+import threading
+from contextlib import contextmanager
+from copy import deepcopy
+from dataclasses import dataclass
+
+import duckdb
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sqlalchemy
 
 from singer_sdk import SQLConnector, SQLStream
-from typing import Optional, Iterable, Dict, Any
+from singer_sdk import _singerlib as singer
+from singer_sdk import typing as th
+from singer_sdk._singerlib import CatalogEntry
+from singer_sdk.helpers._batch import BaseBatchFileEncoding, BatchConfig
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.reflection import Inspector
+from typing import (
+    Optional, Iterable, Iterator, Dict, Any, List, Tuple, Callable, cast
+)
+from uuid import uuid4
+
+# Rows per Arrow record batch read from DuckDB, one DuckDB row group.
+DEFAULT_FETCH_BATCH_SIZE = 122880
+
+# DuckDB's own values of the settings a config may override.
+_DEFAULT_SETTINGS_SQL = (
+    "SELECT current_setting('threads'), current_setting('memory_limit')"
+)
+
+# All columns of all tables and views, in a single round-trip.
+_DISCOVERY_SQL = """
+SELECT
+    c.table_schema,
+    c.table_name,
+    t.table_type,
+    c.column_name,
+    c.data_type,
+    c.is_nullable
+FROM information_schema.columns AS c
+JOIN information_schema.tables AS t
+    ON c.table_catalog IS NOT DISTINCT FROM t.table_catalog
+    AND c.table_schema = t.table_schema
+    AND c.table_name = t.table_name
+ORDER BY c.table_schema, c.table_name, c.ordinal_position
+"""
+
+# Key columns of every table, primary keys ahead of unique constraints.
+_KEYS_SQL = """
+SELECT schema_name, table_name, constraint_column_names
+FROM duckdb_constraints()
+WHERE constraint_type IN ('PRIMARY KEY', 'UNIQUE')
+ORDER BY constraint_type = 'PRIMARY KEY' DESC, constraint_index
+"""
+
+# Types read through a cast, as Arrow hands them over in a form records cannot
+# use: intervals as (months, days, nanoseconds) tuples, and nanosecond timestamps
+# not at all without pandas. Timestamps are truncated to microseconds.
+_READ_CASTS = {
+    "INTERVAL": "VARCHAR",
+    "TIMESTAMP_NS": "TIMESTAMP",
+}
+
+# Columns of one table whose type is read through a cast.
+_CAST_COLUMNS_SQL = """
+SELECT column_name, data_type
+FROM information_schema.columns
+WHERE table_schema = ? AND table_name = ? AND data_type IN ({})
+""".format(", ".join(f"'{data_type}'" for data_type in _READ_CASTS))
+
+# JSON Schema types for DuckDB type names, keyed by the name without parameters.
+_DUCKDB_TYPE_JSON: Dict[str, dict] = {
+    "BOOLEAN": th.BooleanType.type_dict,
+    "TINYINT": th.IntegerType.type_dict,
+    "SMALLINT": th.IntegerType.type_dict,
+    "INTEGER": th.IntegerType.type_dict,
+    "BIGINT": th.IntegerType.type_dict,
+    "HUGEINT": th.IntegerType.type_dict,
+    "UTINYINT": th.IntegerType.type_dict,
+    "USMALLINT": th.IntegerType.type_dict,
+    "UINTEGER": th.IntegerType.type_dict,
+    "UBIGINT": th.IntegerType.type_dict,
+    "FLOAT": th.NumberType.type_dict,
+    "DOUBLE": th.NumberType.type_dict,
+    "DECIMAL": th.NumberType.type_dict,
+    "VARCHAR": th.StringType.type_dict,
+    "UUID": th.StringType.type_dict,
+    "BLOB": th.StringType.type_dict,
+    "INTERVAL": th.StringType.type_dict,
+    "TIME": th.TimeType.type_dict,
+    "DATE": th.DateType.type_dict,
+    "TIMESTAMP": th.DateTimeType.type_dict,
+    "TIMESTAMP_S": th.DateTimeType.type_dict,
+    "TIMESTAMP_MS": th.DateTimeType.type_dict,
+    "TIMESTAMP_NS": th.DateTimeType.type_dict,
+    "TIMESTAMP WITH TIME ZONE": th.DateTimeType.type_dict,
+    "STRUCT": {"type": ["object"]},
+    "MAP": {"type": ["object"]},
+}
+
+
+@dataclass
+class ParquetEncoding(BaseBatchFileEncoding):
+    """Parquet encoding for batch files."""
+
+    __encoding_format__ = "parquet"
+
+
+def _compile_record_builder(names: List[str]) -> Callable[..., Dict[str, Any]]:
+    """Compile a function that builds a record dict from one value per column.
+
+    Every row of a stream shares the same columns, so the keys are baked into a
+    dict display: `lambda v0, v1: {"id": v0, "name": v1}`. CPython then builds each
+    record in one step with constant keys, instead of zipping keys and values.
+    """
+    args = ", ".join(f"v{i}" for i in range(len(names)))
+    items = ", ".join(f"{name!r}: v{i}" for i, name in enumerate(names))
+    namespace: Dict[str, Any] = {}
+    exec(f"def build_record({args}):\n    return {{{items}}}\n", namespace)
+    return cast(Callable[..., Dict[str, Any]], namespace["build_record"])
+
+
+@dataclass
+class _SharedConnection:
+    """A read-only connection to a database file, shared by every connector."""
+
+    connection: duckdb.DuckDBPyConnection
+    # The `threads` and `memory_limit` DuckDB had when the connection was opened.
+    threads: int
+    memory_limit: str
+    # Number of cursors open on the connection, which is closed with the last one.
+    cursors: int = 0
+
+
+# Shared connections by database path.
+_SHARED_CONNECTIONS: Dict[str, _SharedConnection] = {}
+_SHARED_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _close_shared_connections() -> None:
+    """Close every shared DuckDB connection still open, along with its cursors."""
+    with _SHARED_CONNECTIONS_LOCK:
+        for shared in _SHARED_CONNECTIONS.values():
+            shared.connection.close()
+        _SHARED_CONNECTIONS.clear()
+
+
+atexit.register(_close_shared_connections)
+
+
+def _quote(name: str) -> str:
+    """Quote a single identifier for use in a DuckDB statement."""
+    return '"{}"'.format(name.replace('"', '""'))
+
+
+def _literal(value: str) -> str:
+    """Quote a string literal for use in a DuckDB statement."""
+    return "'{}'".format(value.replace("'", "''"))
 
 
 class DuckDBConnector(SQLConnector):
     """Connects to the DuckDB SQL source."""
 
-    def get_sqlalchemy_url(cls, config: dict) -> str:
-        """Concatenate a SQLAlchemy URL for use in connecting to the source."""
-        return (
-            f"duckdb:///{config['path']}"
+    __slots__ = ("_discovery_cache", "_duckdb_connection")
+
+    def __init__(
+        self, config: Optional[dict] = None, sqlalchemy_url: Optional[str] = None
+    ) -> None:
+        """Initialize the DuckDB connector.
+
+        Args:
+            config: The parent tap or target object's config.
+            sqlalchemy_url: Optional URL for the connection.
+        """
+        super().__init__(config=config, sqlalchemy_url=sqlalchemy_url)
+        self._discovery_cache: Optional[Dict[str, Dict[str, dict]]] = None
+        self._duckdb_connection: Optional[duckdb.DuckDBPyConnection] = None
+
+    def get_sqlalchemy_url(self, config: dict) -> str:
+        """Concatenate a SQLAlchemy URL for use in connecting to the source.
+
+        The result is memoized by the `sqlalchemy_url` property, so this runs once
+        per connector.
+        """
+        return f"duckdb:///{config['path']}"
+
+    def create_duckdb_connection(self) -> duckdb.DuckDBPyConnection:
+        """Return a new native read-only DuckDB cursor on the source.
+
+        All connectors for the same file share one read-only connection, kept in
+        `_SHARED_CONNECTIONS`, and each gets its own cursor on it. Cursors are cheap,
+        safe to use from separate threads, and read through the same buffer pool,
+        so pages one stream has scanned stay warm for the next. Pass the cursor to
+        `release_duckdb_connection` when done; the shared connection is closed with
+        its last cursor, which frees the file for other processes.
+
+        Singer targets do not rely on record order, so `preserve_insertion_order` is
+        turned off to let DuckDB skip order-preserving materialization during
+        scans. Streams with a replication key still sort by it explicitly.
+
+        `threads` and `memory_limit` are applied from the config, and reset to
+        DuckDB's defaults when unset. Settings are applied with `SET` rather than
+        as connect options, because DuckDB refuses a second handle to the same file
+        whose options differ from the first. `SET` changes the whole DuckDB
+        instance, not just this cursor, so the settings are global to every
+        connector reading the file at the same time, including those of other taps
+        in the process.
+
+        Returns:
+            A newly created DuckDB cursor object.
+        """
+        path = self.config["path"]
+        with _SHARED_CONNECTIONS_LOCK:
+            shared = _SHARED_CONNECTIONS.get(path)
+            if shared is None:
+                connection = duckdb.connect(path, read_only=True)
+                defaults = connection.execute(_DEFAULT_SETTINGS_SQL).fetchone()
+                shared = _SharedConnection(
+                    connection, *cast(Tuple[int, str], defaults)
+                )
+                _SHARED_CONNECTIONS[path] = shared
+            con = shared.connection.cursor()
+            shared.cursors += 1
+
+        con.execute("SET preserve_insertion_order = false")
+
+        threads = self.config.get("threads")
+        if threads:
+            con.execute(f"SET threads = {int(threads)}")
+        else:
+            self._reset_setting(con, "threads", shared.threads)
+
+        memory_limit = self.config.get("memory_limit")
+        if memory_limit:
+            con.execute(f"SET memory_limit = {_literal(memory_limit)}")
+        else:
+            self._reset_setting(con, "memory_limit", _literal(shared.memory_limit))
+
+        return con
+
+    @staticmethod
+    def _reset_setting(con: duckdb.DuckDBPyConnection, name: str, default: Any) -> None:
+        """Restore a DuckDB setting to its default.
+
+        Args:
+            con: The DuckDB cursor.
+            name: The setting's name.
+            default: SQL for the value to set if `RESET` is unavailable.
+        """
+        try:
+            con.execute(f"RESET {name}")
+        except duckdb.ParserException:
+            # DuckDB 0.6 has no RESET. Its value at open time is the default.
+            con.execute(f"SET {name} = {default}")
+
+    def release_duckdb_connection(self, con: duckdb.DuckDBPyConnection) -> None:
+        """Close a cursor from `create_duckdb_connection`.
+
+        The shared connection it came from is closed too, once no cursors are left
+        on it.
+
+        Args:
+            con: The cursor to close.
+        """
+        con.close()
+        path = self.config["path"]
+        with _SHARED_CONNECTIONS_LOCK:
+            shared = _SHARED_CONNECTIONS.get(path)
+            if shared is None:
+                return
+
+            shared.cursors -= 1
+            if not shared.cursors:
+                del _SHARED_CONNECTIONS[path]
+                shared.connection.close()
+
+    def close_duckdb_connection(self) -> None:
+        """Release the native DuckDB connection, if one is open."""
+        if self._duckdb_connection is not None:
+            self.release_duckdb_connection(self._duckdb_connection)
+            self._duckdb_connection = None
+
+    @property
+    def duckdb_connection(self) -> duckdb.DuckDBPyConnection:
+        """Return or set the native DuckDB connection object.
+
+        Streams read records through this connection; the SQLAlchemy connection is
+        never opened for reads.
+
+        Returns:
+            The active DuckDB connection object.
+        """
+        if not self._duckdb_connection:
+            self._duckdb_connection = self.create_duckdb_connection()
+
+        return self._duckdb_connection
+
+    @property
+    def discovery_cache(self) -> Dict[str, Dict[str, dict]]:
+        """Return metadata for every table and view, grouped by schema.
+
+        The metadata is read once from DuckDB and reused by every discovery step
+        that follows.
+
+        Returns:
+            A mapping of schema name to table name to that table's metadata, with
+            `is_view`, `key_properties` and `columns` keys.
+        """
+        if self._discovery_cache is None:
+            self._discovery_cache = self._load_discovery_cache()
+
+        return self._discovery_cache
+
+    def _load_discovery_cache(self) -> Dict[str, Dict[str, dict]]:
+        """Fetch column and key metadata for the whole database in bulk.
+
+        Returns:
+            A mapping of schema name to table name to that table's metadata.
+        """
+        con = self.create_duckdb_connection()
+        try:
+            columns = con.execute(_DISCOVERY_SQL).fetch_arrow_table()
+            keys = con.execute(_KEYS_SQL).fetch_arrow_table()
+        finally:
+            self.release_duckdb_connection(con)
+
+        cache: Dict[str, Dict[str, dict]] = {}
+        for row in columns.to_pylist():
+            table = cache.setdefault(row["table_schema"], {}).setdefault(
+                row["table_name"],
+                {
+                    "is_view": row["table_type"] == "VIEW",
+                    "key_properties": [],
+                    "columns": [],
+                },
+            )
+            table["columns"].append(row)
+
+        # Primary keys sort first, so the first constraint seen wins.
+        for row in keys.to_pylist():
+            keyed = cache.get(row["schema_name"], {}).get(row["table_name"])
+            if keyed is not None and not keyed["key_properties"]:
+                keyed["key_properties"] = row["constraint_column_names"]
+
+        return cache
+
+    def get_schema_names(self, engine: Engine, inspected: Inspector) -> List[str]:
+        """Return a list of schema names in DB.
+
+        Args:
+            engine: SQLAlchemy engine
+            inspected: SQLAlchemy inspector instance for engine
+
+        Returns:
+            List of schema names
+        """
+        return list(self.discovery_cache)
+
+    def get_object_names(
+        self, engine: Engine, inspected: Inspector, schema_name: str
+    ) -> List[Tuple[str, bool]]:
+        """Return a list of syncable objects.
+
+        Args:
+            engine: SQLAlchemy engine
+            inspected: SQLAlchemy inspector instance for engine
+            schema_name: Schema name to inspect
+
+        Returns:
+            List of tuples (<table_or_view_name>, <is_view>)
+        """
+        return [
+            (table_name, table["is_view"])
+            for table_name, table in self.discovery_cache.get(schema_name, {}).items()
+        ]
+
+    def discover_catalog_entry(
+        self,
+        engine: Engine,
+        inspected: Inspector,
+        schema_name: str,
+        table_name: str,
+        is_view: bool,
+    ) -> CatalogEntry:
+        """Create `CatalogEntry` object for the given table or a view.
+
+        Args:
+            engine: SQLAlchemy engine
+            inspected: SQLAlchemy inspector instance for engine
+            schema_name: Schema name to inspect
+            table_name: Name of the table or a view
+            is_view: Flag whether this object is a view, returned by `get_object_names`
+
+        Returns:
+            `CatalogEntry` object for the given table or a view
+        """
+        entry = self._build_catalog_entry(schema_name, table_name)
+        return cast(CatalogEntry, CatalogEntry.from_dict(entry))
+
+    def _build_catalog_entry(self, schema_name: str, table_name: str) -> dict:
+        """Create the catalog entry for a table or view in `discovery_cache`.
+
+        The result has the same shape as `CatalogEntry.to_dict()`, but is built
+        straight from the cached metadata without intermediate `CatalogEntry`,
+        `Schema` or `MetadataMapping` objects.
+
+        Args:
+            schema_name: Schema name of the table or view.
+            table_name: Name of the table or view.
+
+        Returns:
+            The catalog entry as a dict.
+        """
+        table = self.discovery_cache[schema_name][table_name]
+        unique_stream_id = self.get_fully_qualified_name(
+            db_name=None,
+            schema_name=schema_name,
+            table_name=table_name,
+            delimiter="-",
         )
+        key_properties = table["key_properties"]
+
+        replication_method = ""  # Matches the SDK's discovery output.
+
+        properties: Dict[str, dict] = {}
+        required: List[str] = []
+        metadata: List[dict] = []
+        for column in table["columns"]:
+            column_name = column["column_name"]
+            jsonschema_type = self.to_jsonschema_type(column["data_type"])
+            if column["is_nullable"] == "NO":
+                required.append(column_name)
+            else:
+                jsonschema_type["type"].append("null")
+            properties[column_name] = jsonschema_type
+
+            is_key = column_name in key_properties
+            metadata.append(
+                {
+                    "breadcrumb": ["properties", column_name],
+                    "metadata": {"inclusion": "automatic" if is_key else "available"},
+                }
+            )
+
+        schema: Dict[str, Any] = {"properties": properties, "type": "object"}
+        if required:
+            schema["required"] = required
+
+        metadata.append(
+            {
+                "breadcrumb": [],
+                "metadata": {
+                    "inclusion": "available",
+                    "table-key-properties": key_properties,
+                    "forced-replication-method": replication_method,
+                    "schema-name": schema_name,
+                },
+            }
+        )
+
+        return {
+            "tap_stream_id": unique_stream_id,
+            "table_name": table_name,
+            "replication_method": replication_method,
+            "key_properties": key_properties,
+            "schema": schema,
+            "is_view": table["is_view"],
+            "stream": unique_stream_id,
+            "metadata": metadata,
+        }
+
+    def discover_catalog_entries(self) -> List[dict]:
+        """Return a list of catalog entries from discovery.
+
+        Metadata is refreshed in bulk once up front; no SQLAlchemy engine or
+        inspector is created.
+
+        Returns:
+            The discovered catalog entries as a list.
+        """
+        self._discovery_cache = self._load_discovery_cache()
+        return [
+            self._build_catalog_entry(schema_name, table_name)
+            for schema_name, tables in self._discovery_cache.items()
+            for table_name in tables
+        ]
+
+    def parse_full_table_name(
+        self, full_table_name: str
+    ) -> Tuple[Optional[str], Optional[str], str]:
+        """Parse a fully qualified table name into its parts.
+
+        Args:
+            full_table_name: A table name, `<schema>.<table>` or
+                `<db>.<schema>.<table>`.
+
+        Returns:
+            A three part tuple (db_name, schema_name, table_name) with any unspecified
+            or unused parts returned as None.
+        """
+        head, sep, table_name = full_table_name.rpartition(".")
+        if not sep:
+            return None, None, table_name
+
+        db_name, sep, schema_name = head.rpartition(".")
+        return db_name if sep else None, schema_name, table_name
 
     @staticmethod
-    def to_jsonschema_type(sql_type: sqlalchemy.types.TypeEngine) -> dict:
+    def to_jsonschema_type(sql_type: Any) -> dict:
         """Returns a JSON Schema equivalent for the given SQL type.
 
-        Developers may optionally add custom logic before calling the default
-        implementation inherited from the base class.
+        DuckDB type names, as reported by `information_schema`, are resolved with a
+        lookup in `_DUCKDB_TYPE_JSON`. Anything else goes to the base class.
         """
-        # Optionally, add custom logic before calling the parent SQLConnector method.
-        # You may delete this method if overrides are not needed.
-        return SQLConnector.to_jsonschema_type(sql_type)
+        if not isinstance(sql_type, str):
+            return SQLConnector.to_jsonschema_type(sql_type)
+
+        if sql_type.endswith("]"):
+            # List elements are nullable whatever the column's own nullability.
+            items = DuckDBConnector.to_jsonschema_type(sql_type[: sql_type.rindex("[")])
+            items["type"].append("null")
+            return {"type": ["array"], "items": items}
+
+        jsonschema_type = _DUCKDB_TYPE_JSON.get(
+            sql_type.split("(", 1)[0].upper(), th.StringType.type_dict
+        )
+        return {**jsonschema_type, "type": list(jsonschema_type["type"])}
 
     @staticmethod
     def to_sql_type(jsonschema_type: dict) -> sqlalchemy.types.TypeEngine:
@@ -39,7 +542,20 @@ class DuckDBConnector(SQLConnector):
         # Optionally, add custom logic before calling the parent SQLConnector method.
         # You may delete this method if overrides are not needed.
         return SQLConnector.to_sql_type(jsonschema_type)
-    
+
+    def create_sqlalchemy_engine(self) -> sqlalchemy.engine.Engine:
+        """Return a new SQLAlchemy engine using the provided config.
+
+        The engine opens the database read-only so that it can share the DuckDB
+        instance with the native connections streams use to read records.
+
+        Returns:
+            A newly created SQLAlchemy engine object.
+        """
+        return sqlalchemy.create_engine(
+            self.sqlalchemy_url, echo=False, connect_args={"read_only": True}
+        )
+
     def create_sqlalchemy_connection(self) -> sqlalchemy.engine.Connection:
         """Return a new SQLAlchemy connection using the provided config.
 
@@ -66,20 +582,243 @@ class DuckDBStream(SQLStream):
 
     connector_class = DuckDBConnector
 
-    def get_records(self, partition: Optional[dict]) -> Iterable[Dict[str, Any]]:
+    # Guards the tap state shared by streams that sync in parallel.
+    state_lock = threading.RLock()
+
+    # The shared tap state, while this stream keeps its bookmarks in a private copy.
+    _shared_tap_state: Optional[dict] = None
+
+    @property
+    def connector(self) -> DuckDBConnector:
+        """Return a connector object.
+
+        Returns:
+            The connector object.
+        """
+        return cast(DuckDBConnector, self._connector)
+
+    @property
+    def fetch_batch_size(self) -> int:
+        """Return the number of rows per Arrow record batch read from DuckDB.
+
+        Returns:
+            The configured `fetch_batch_size`, or the default.
+        """
+        return self.config.get("fetch_batch_size") or DEFAULT_FETCH_BATCH_SIZE
+
+    @contextmanager
+    def private_state(self) -> Iterator[None]:
+        """Keep this stream's bookmarks in a private copy of the tap state.
+
+        The SDK updates stream state in many places, some of them outside any
+        method a stream can override. While streams sync in parallel, each one
+        works on its own copy instead, so no thread mutates a dict another is
+        serializing. The copy is merged back into the shared tap state, under
+        `state_lock`, with every STATE message and on exit.
+
+        Yields:
+            None, once the private state is in place.
+        """
+        with self.state_lock:
+            shared_tap_state = self._tap_state
+            self._shared_tap_state = shared_tap_state
+            self._tap_state = {"bookmarks": {self.name: deepcopy(self.stream_state)}}
+        try:
+            yield
+        finally:
+            with self.state_lock:
+                self._merge_stream_state()
+                self._tap_state = shared_tap_state
+                self._shared_tap_state = None
+
+    def _merge_stream_state(self) -> None:
+        """Copy this stream's private bookmarks into the shared tap state."""
+        if self._shared_tap_state is not None:
+            self._shared_tap_state["bookmarks"][self.name] = deepcopy(self.stream_state)
+
+    def _write_state_message(self) -> None:
+        """Write out a STATE message with the latest state of every stream."""
+        with self.state_lock:
+            if self._shared_tap_state is None:
+                super()._write_state_message()
+                return
+
+            self._merge_stream_state()
+            singer.write_message(singer.StateMessage(value=self._shared_tap_state))
+
+    def _fetch_record_batches(
+        self, sql: str, params: List[Any], chunk_size: int = DEFAULT_FETCH_BATCH_SIZE
+    ) -> pa.RecordBatchReader:
+        """Execute a query natively in DuckDB and return a reader over its results.
+
+        Args:
+            sql: The SELECT statement to run.
+            params: Positional parameters bound to the statement.
+            chunk_size: Maximum number of rows per Arrow record batch.
+
+        Returns:
+            An Arrow record batch reader.
+        """
+        con = self.connector.duckdb_connection
+        return con.execute(sql, params).fetch_record_batch(chunk_size)
+
+    def _iter_arrow_batches(
+        self, sql: str, params: List[Any], chunk_size: int = DEFAULT_FETCH_BATCH_SIZE
+    ) -> Iterable[Dict[str, Any]]:
+        """Execute a query natively in DuckDB and yield its rows from Arrow batches.
+
+        Args:
+            sql: The SELECT statement to run.
+            params: Positional parameters bound to the statement.
+            chunk_size: Maximum number of rows per Arrow record batch.
+
+        Yields:
+            One dict per record.
+        """
+        reader = self._fetch_record_batches(sql, params, chunk_size)
+        build_record = _compile_record_builder(reader.schema.names)
+        # Arrow gives MAP values as lists of (key, value) pairs, not objects.
+        map_columns = [
+            i for i, field in enumerate(reader.schema) if pa.types.is_map(field.type)
+        ]
+        for batch in reader:
+            columns = [col.to_pylist() for col in batch.columns]
+            for i in map_columns:
+                columns[i] = [
+                    None if pairs is None else dict(pairs) for pairs in columns[i]
+                ]
+            yield from map(build_record, *columns)
+
+    def _get_column_casts(self) -> Dict[str, str]:
+        """Return the types this stream's columns are read as, where not their own.
+
+        See `_READ_CASTS`.
+
+        Returns:
+            A mapping of column name to the type to cast it to.
+        """
+        _, schema_name, table_name = self.connector.parse_full_table_name(
+            self.fully_qualified_name
+        )
+        rows = self.connector.duckdb_connection.execute(
+            _CAST_COLUMNS_SQL, [schema_name, table_name]
+        ).fetchall()
+        return {column_name: _READ_CASTS[data_type] for column_name, data_type in rows}
+
+    def _get_records_query(self, context: Optional[dict]) -> Tuple[str, List[Any]]:
+        """Build the SELECT statement that reads this stream's records.
+
+        Args:
+            context: If partition context is provided, will read specifically from
+                this data slice.
+
+        Returns:
+            The SQL statement and its positional parameters.
+
+        Raises:
+            NotImplementedError: If partition is passed in context and the stream does
+                not support partitioning.
+        """
+        if context:
+            raise NotImplementedError(
+                f"Stream '{self.name}' does not support partitioning."
+            )
+
+        selected_column_names = self.get_selected_schema()["properties"].keys()
+        table_name = ".".join(
+            _quote(part) for part in self.fully_qualified_name.split(".")
+        )
+        casts = {
+            name: f"CAST({_quote(name)} AS {data_type}) AS {_quote(name)}"
+            for name, data_type in self._get_column_casts().items()
+        }
+        if selected_column_names:
+            columns = ", ".join(
+                casts.get(name, _quote(name)) for name in selected_column_names
+            )
+        elif casts:
+            columns = "* REPLACE ({})".format(", ".join(casts.values()))
+        else:
+            columns = "*"
+        sql = f"SELECT {columns} FROM {table_name}"
+        params: List[Any] = []
+
+        if self.replication_key:
+            replication_key_col = _quote(self.replication_key)
+            start_val = self.get_starting_replication_key_value(context)
+            if start_val:
+                sql += f" WHERE {replication_key_col} >= ?"
+                params.append(start_val)
+            sql += f" ORDER BY {replication_key_col}"
+
+        if self._MAX_RECORDS_LIMIT is not None:
+            sql += f" LIMIT {int(self._MAX_RECORDS_LIMIT)}"
+
+        return sql, params
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
         """Return a generator of record-type dictionary objects.
 
-        Developers may optionally add custom logic before calling the default
-        implementation inherited from the base class.
+        Records are read through DuckDB's native Arrow interface rather than the
+        SQLAlchemy connection, which is only used for discovery.
 
         Args:
-            partition: If provided, will read specifically from this data slice.
+            context: If partition context is provided, will read specifically from
+                this data slice.
 
         Yields:
             One dict per record.
         """
-        # Optionally, add custom logic instead of calling the super().
-        # This is helpful if the source database provides batch-optimized record
-        # retrieval.
-        # If no overrides or optimizations are needed, you may delete this method.
-        yield from super().get_records(partition)
+        sql, params = self._get_records_query(context)
+        yield from self._iter_arrow_batches(sql, params, self.fetch_batch_size)
+
+    def get_batches(
+        self, batch_config: BatchConfig, context: Optional[dict] = None
+    ) -> Iterable[Tuple[BaseBatchFileEncoding, List[str]]]:
+        """Batch generator function.
+
+        With the `parquet` encoding, Arrow record batches are streamed from DuckDB
+        straight into a single Parquet file, without building a dict per record.
+        Other encodings are handled by the base class.
+
+        Args:
+            batch_config: Batch config for this stream.
+            context: Stream partition or context dictionary.
+
+        Yields:
+            A tuple of (encoding, manifest) for each batch.
+        """
+        if not isinstance(batch_config.encoding, ParquetEncoding):
+            yield from super().get_batches(batch_config, context)
+            return
+
+        self._write_starting_replication_value(context)
+        sql, params = self._get_records_query(context)
+        reader = self._fetch_record_batches(sql, params, self.fetch_batch_size)
+        batches = (batch for batch in reader if batch.num_rows)
+        last_batch = next(batches, None)
+        # Nothing to sync, so no file is created.
+        if last_batch is None:
+            return
+
+        sync_id = f"{self.tap_name}--{self.name}-{uuid4()}"
+        filename = f"{batch_config.storage.prefix or ''}{sync_id}.parquet"
+        with batch_config.storage.fs() as fs:
+            with fs.open(filename, "wb") as f:
+                with pq.ParquetWriter(
+                    f,
+                    reader.schema,
+                    compression=batch_config.encoding.compression or "snappy",
+                ) as writer:
+                    writer.write_batch(last_batch)
+                    for batch in batches:
+                        writer.write_batch(batch)
+                        last_batch = batch
+            file_url = fs.geturl(filename)
+
+        # Rows are sorted by the replication key, so the last row holds the bookmark.
+        self._increment_stream_state(
+            last_batch.slice(last_batch.num_rows - 1).to_pylist()[0],
+            context=context,
+        )
+        yield batch_config.encoding, [file_url]
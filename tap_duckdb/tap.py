@@ -1,16 +1,33 @@
 """DuckDB tap class."""
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, List, Type, cast
 
-from singer_sdk import SQLTap, SQLStream
+from singer_sdk import SQLTap
 from singer_sdk import typing as th  # JSON schema typing helpers
-from tap_duckdb.client import DuckDBStream
+from singer_sdk.helpers._classproperty import classproperty
+
+if TYPE_CHECKING:
+    from tap_duckdb.client import DuckDBStream
 
 
 class TapDuckDB(SQLTap):
     """DuckDB tap class."""
     name = "tap-duckdb"
-    default_stream_class = DuckDBStream
+
+    @classproperty
+    def default_stream_class(cls) -> Type["DuckDBStream"]:
+        """Return the stream class, importing it on first use.
+
+        `--about`, `--help` and `--version` never need streams, so they skip
+        importing DuckDB and Arrow.
+
+        Returns:
+            The DuckDB stream class.
+        """
+        from tap_duckdb.client import DuckDBStream
+
+        return DuckDBStream
 
     config_jsonschema = th.PropertiesList(
         th.Property(
@@ -19,8 +36,121 @@ class TapDuckDB(SQLTap):
             required=True,
             description="Path to .duckdb file"
         ),
+        th.Property(
+            "fetch_batch_size",
+            th.IntegerType,
+            default=122880,
+            description="Number of rows per Arrow record batch read from DuckDB"
+        ),
+        th.Property(
+            "threads",
+            th.IntegerType,
+            description="Number of threads DuckDB may use for queries"
+        ),
+        th.Property(
+            "memory_limit",
+            th.StringType,
+            description="Maximum memory DuckDB may use for queries, e.g. '4GB'"
+        ),
+        th.Property(
+            "max_parallel_streams",
+            th.IntegerType,
+            default=1,
+            description="Maximum number of streams to sync at the same time"
+        ),
+        th.Property(
+            "batch_config",
+            th.ObjectType(
+                th.Property(
+                    "encoding",
+                    th.ObjectType(
+                        th.Property(
+                            "format",
+                            th.StringType,
+                            allowed_values=["jsonl", "parquet"],
+                            description="Batch file format"
+                        ),
+                        th.Property(
+                            "compression",
+                            th.StringType,
+                            description="Batch file compression, e.g. gzip or zstd"
+                        ),
+                    ),
+                ),
+                th.Property(
+                    "storage",
+                    th.ObjectType(
+                        th.Property(
+                            "root",
+                            th.StringType,
+                            description="Root URL of the batch file storage"
+                        ),
+                        th.Property(
+                            "prefix",
+                            th.StringType,
+                            description="Prefix for batch file names"
+                        ),
+                    ),
+                ),
+            ),
+            description="Emit BATCH messages instead of RECORD messages"
+        ),
     ).to_dict()
 
+    def sync_all(self) -> None:  # type: ignore[misc]
+        """Sync all streams, up to `max_parallel_streams` of them at a time.
+
+        Streams' DuckDB connections are closed once the sync ends, so the database
+        file is not held open for the rest of the process.
+        """
+        max_parallel_streams = self.config.get("max_parallel_streams") or 1
+        try:
+            if max_parallel_streams <= 1:
+                super().sync_all()
+            else:
+                self._sync_all_parallel(max_parallel_streams)
+        finally:
+            for stream in self.streams.values():
+                cast("DuckDBStream", stream).connector.close_duckdb_connection()
+
+    def _sync_all_parallel(self, max_parallel_streams: int) -> None:
+        """Sync all streams on a pool of threads.
+
+        Args:
+            max_parallel_streams: Maximum number of streams to sync at the same time.
+        """
+        self._reset_state_progress_markers()
+        self._set_compatible_replication_methods()
+        streams: List["DuckDBStream"] = []
+        for stream in self.streams.values():
+            if not stream.selected and not stream.has_selected_descendents:
+                self.logger.info(f"Skipping deselected stream '{stream.name}'.")
+                continue
+
+            # The SDK also skips streams with a `parent_stream_type` here, since
+            # their parents sync them. Every stream of this tap is a table or view
+            # from the catalog, and none has a parent.
+            streams.append(cast("DuckDBStream", stream))
+
+        with ThreadPoolExecutor(max_workers=max_parallel_streams) as executor:
+            for future in [executor.submit(self._sync_stream, s) for s in streams]:
+                future.result()
+
+        for stream in self.streams.values():
+            stream.log_sync_costs()
+
+    @staticmethod
+    def _sync_stream(stream: "DuckDBStream") -> None:
+        """Sync one stream and write its final state.
+
+        Args:
+            stream: The stream to sync.
+        """
+        with stream.private_state():
+            stream.sync()
+            stream.finalize_state_progress_markers()
+            stream._write_state_message()
+
 
 if __name__ == "__main__":
     TapDuckDB.cli()
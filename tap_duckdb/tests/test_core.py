@@ -1,26 +1,276 @@
 """Tests standard tap features using the built-in SDK tests library."""
 
 import datetime
+import json
+import shutil
 
+import duckdb
+import pyarrow.parquet as pq
+import pytest
+from singer_sdk.helpers._batch import BatchConfig
 from singer_sdk.testing import get_standard_tap_tests
 
+from tap_duckdb.client import DuckDBConnector
 from tap_duckdb.tap import TapDuckDB
 
 SAMPLE_CONFIG = {
     "start_date": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d")
-    # TODO: Initialize minimal tap config
 }
 
 
+@pytest.fixture(scope="module")
+def sample_config(tmp_path_factory):
+    """Create a small DuckDB database and return a tap config pointing at it."""
+    path = tmp_path_factory.mktemp("data") / "sample.duckdb"
+    con = duckdb.connect(str(path))
+    con.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name VARCHAR, score DOUBLE)"
+    )
+    con.execute(
+        "INSERT INTO users SELECT i, 'user ' || i, i * 0.5 FROM range(10) AS t(i)"
+    )
+    con.execute("CREATE VIEW user_names AS SELECT id, name FROM users")
+    con.close()
+    return {**SAMPLE_CONFIG, "path": str(path)}
+
+
 # Run standard built-in tap tests from the SDK:
-def test_standard_tap_tests():
+def test_standard_tap_tests(sample_config):
     """Run standard tap tests from the SDK."""
     tests = get_standard_tap_tests(
         TapDuckDB,
-        config=SAMPLE_CONFIG
+        config=sample_config
     )
     for test in tests:
         test()
 
 
-# TODO: Create additional tests as appropriate for your tap.
+def test_discover_catalog(sample_config):
+    """Build catalog entries from the cached `information_schema` metadata."""
+    tap = TapDuckDB(config=sample_config)
+    streams = {entry["tap_stream_id"]: entry for entry in tap.catalog_dict["streams"]}
+
+    assert sorted(streams) == ["main-user_names", "main-users"]
+    assert streams["main-user_names"]["is_view"] is True
+    assert streams["main-users"]["is_view"] is False
+    assert streams["main-users"]["key_properties"] == ["id"]
+    assert streams["main-user_names"]["key_properties"] == []
+    assert streams["main-user_names"]["metadata"][-1]["metadata"][
+        "table-key-properties"
+    ] == []
+    assert streams["main-users"]["schema"]["required"] == ["id"]
+    assert streams["main-users"]["schema"]["properties"] == {
+        "id": {"type": ["integer"]},
+        "name": {"type": ["string", "null"]},
+        "score": {"type": ["number", "null"]},
+    }
+
+
+def test_interval_and_list_columns(tmp_path):
+    """Read columns whose Arrow values need converting to fit their schema."""
+    path = tmp_path / "types.duckdb"
+    con = duckdb.connect(str(path))
+    con.execute(
+        "CREATE TABLE events (wait INTERVAL, tags INTEGER[], "
+        "counts MAP(VARCHAR, INTEGER), seen TIMESTAMP_NS)"
+    )
+    con.execute(
+        "INSERT INTO events VALUES (INTERVAL 3 DAY, [1, NULL], map(['k'], [1]), "
+        "'2023-01-02 03:04:05.123456789')"
+    )
+    con.close()
+    tap = TapDuckDB(config={"path": str(path)})
+    stream = tap.streams["main-events"]
+
+    records = list(stream.get_records(None))
+
+    assert stream.schema["properties"]["tags"] == {
+        "type": ["array", "null"],
+        "items": {"type": ["integer", "null"]},
+    }
+    assert stream.schema["properties"]["counts"] == {"type": ["object", "null"]}
+    assert records == [
+        {
+            "wait": "3 days",
+            "tags": [1, None],
+            "counts": {"k": 1},
+            "seen": datetime.datetime(2023, 1, 2, 3, 4, 5, 123456),
+        }
+    ]
+    stream.connector.close_duckdb_connection()
+
+
+def test_get_records(sample_config):
+    """Read records through the native DuckDB client, across several batches."""
+    tap = TapDuckDB(config={**sample_config, "fetch_batch_size": 2})
+    stream = tap.streams["main-users"]
+    stream.replication_key = "id"
+    stream._MAX_RECORDS_LIMIT = 3
+
+    records = list(stream.get_records(None))
+
+    assert records == [
+        {"id": 0, "name": "user 0", "score": 0.0},
+        {"id": 1, "name": "user 1", "score": 0.5},
+        {"id": 2, "name": "user 2", "score": 1.0},
+    ]
+
+
+def test_duckdb_connection_settings(tmp_path):
+    """Apply scan settings from the config to the native DuckDB connection."""
+    # Settings are global to the DuckDB instance, so use a database of its own.
+    path = tmp_path / "settings.duckdb"
+    duckdb.connect(str(path)).close()
+    connector = DuckDBConnector(
+        config={"path": str(path), "threads": 2, "memory_limit": "256MB"}
+    )
+
+    con = connector.duckdb_connection
+    settings = con.execute(
+        "SELECT current_setting('preserve_insertion_order'), "
+        "current_setting('threads'), current_setting('memory_limit')"
+    ).fetchone()
+    connector.close_duckdb_connection()
+
+    # DuckDB reports memory limits in its own units, which vary between versions.
+    reference = duckdb.connect()
+    reference.execute("SET memory_limit = '256MB'")
+    memory_limit = reference.execute("SELECT current_setting('memory_limit')")
+    assert settings == (False, 2, memory_limit.fetchone()[0])
+
+
+def test_duckdb_connection_default_settings(tmp_path):
+    """Restore DuckDB's defaults for settings another config has changed."""
+    path = tmp_path / "settings.duckdb"
+    duckdb.connect(str(path)).close()
+    configured = DuckDBConnector(
+        config={"path": str(path), "threads": 3, "memory_limit": "256MB"}
+    )
+    configured.duckdb_connection
+    connector = DuckDBConnector(config={"path": str(path)})
+
+    settings_sql = "SELECT current_setting('threads'), current_setting('memory_limit')"
+    settings = connector.duckdb_connection.execute(settings_sql).fetchone()
+    connector.close_duckdb_connection()
+    configured.close_duckdb_connection()
+
+    assert settings == duckdb.connect().execute(settings_sql).fetchone()
+
+
+def test_get_batches_parquet(sample_config, tmp_path):
+    """Write a stream's rows to a Parquet batch file."""
+    tap = TapDuckDB(config=sample_config)
+    stream = tap.streams["main-users"]
+    batch_config = BatchConfig.from_dict(
+        {
+            "encoding": {"format": "parquet", "compression": "zstd"},
+            "storage": {"root": tmp_path.as_uri(), "prefix": "batch-"},
+        }
+    )
+
+    batches = list(stream.get_batches(batch_config))
+
+    assert len(batches) == 1
+    encoding, manifest = batches[0]
+    assert encoding.format == "parquet"
+    table = pq.read_table(manifest[0][len("file://"):])
+    assert table.num_rows == 10
+    assert table.column_names == ["id", "name", "score"]
+
+
+def test_get_batches_parquet_from_bookmark(sample_config, tmp_path):
+    """Resume a Parquet batch from the stream's replication key bookmark."""
+    state = {
+        "bookmarks": {
+            "main-users": {"replication_key": "id", "replication_key_value": 7}
+        }
+    }
+    tap = TapDuckDB(config=sample_config, state=state)
+    stream = tap.streams["main-users"]
+    stream.replication_key = "id"
+    batch_config = BatchConfig.from_dict(
+        {
+            "encoding": {"format": "parquet"},
+            "storage": {"root": tmp_path.as_uri()},
+        }
+    )
+
+    batches = list(stream.get_batches(batch_config))
+
+    table = pq.read_table(batches[0][1][0][len("file://"):])
+    assert table.column("id").to_pylist() == [7, 8, 9]
+
+
+def test_get_batches_parquet_without_rows(sample_config, tmp_path):
+    """Write no Parquet file when the stream has no new rows."""
+    state = {
+        "bookmarks": {
+            "main-users": {"replication_key": "id", "replication_key_value": 10}
+        }
+    }
+    tap = TapDuckDB(config=sample_config, state=state)
+    stream = tap.streams["main-users"]
+    stream.replication_key = "id"
+    batch_config = BatchConfig.from_dict(
+        {"encoding": {"format": "parquet"}, "storage": {"root": tmp_path.as_uri()}}
+    )
+
+    assert list(stream.get_batches(batch_config)) == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_sync_with_catalog_skips_discovery(
+    sample_config, monkeypatch, capsys, tmp_path
+):
+    """Sync only the selected columns of a given catalog without reflecting."""
+    catalog = TapDuckDB(config=sample_config).catalog_dict
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            if metadata["breadcrumb"] == []:
+                metadata["metadata"]["selected"] = entry["table_name"] == "users"
+            elif metadata["breadcrumb"] == ["properties", "score"]:
+                metadata["metadata"]["selected"] = False
+
+    def fail(*args, **kwargs):
+        raise AssertionError("Discovery should not run when a catalog is given.")
+
+    monkeypatch.setattr(DuckDBConnector, "_load_discovery_cache", fail)
+    monkeypatch.setattr(DuckDBConnector, "create_sqlalchemy_engine", fail)
+    # A copy of the database, which nothing else in this module opens.
+    path = tmp_path / "copy.duckdb"
+    shutil.copyfile(sample_config["path"], path)
+    tap = TapDuckDB(config={**sample_config, "path": str(path)}, catalog=catalog)
+
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    records = [message for message in messages if message["type"] == "RECORD"]
+    assert len(records) == 10
+    assert records[0]["record"] == {"id": 0, "name": "user 0"}
+
+    # The file is no longer held open read-only once the sync ends.
+    duckdb.connect(str(path)).close()
+
+
+def test_sync_all_parallel(sample_config, capsys):
+    """Sync every stream on its own thread."""
+    catalog = TapDuckDB(config=sample_config).catalog_dict
+    for entry in catalog["streams"]:
+        for metadata in entry["metadata"]:
+            if not metadata["breadcrumb"]:
+                metadata["metadata"]["selected"] = True
+    tap = TapDuckDB(
+        config={**sample_config, "max_parallel_streams": 2}, catalog=catalog
+    )
+
+    tap.sync_all()
+
+    messages = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    records = [message for message in messages if message["type"] == "RECORD"]
+    assert len(records) == 20
+    assert messages[-1]["type"] == "STATE"
+    assert sorted(messages[-1]["value"]["bookmarks"]) == [
+        "main-user_names",
+        "main-users",
+    ]
+    assert tap.state == messages[-1]["value"]